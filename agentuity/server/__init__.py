@@ -1,3 +1,5 @@
+import copy
+import functools
 import importlib.util
 import json
 import logging
@@ -26,24 +28,27 @@ from .keyvalue import KeyValueStore
 from .vector import VectorStore
 from .objectstore import ObjectStore
 from .data import dataLikeToData
+from .agent import close_http_client
 
 logger = logging.getLogger(__name__)
+_TRACER = trace.get_tracer("http-server")
 port = int(os.environ.get("AGENTUITY_CLOUD_PORT", os.environ.get("PORT", 3500)))
 
 
+_BEGINS_WITH_NUMBER_RE = re.compile(r"^\d+")
+_UNSAFE_PYTHON_NAME_RE = re.compile(r"[^0-9a-zA-Z_]")
+_STARTING_DASHES_RE = re.compile(r"^-+")
+_ENDING_DASHES_RE = re.compile(r"-+$")
+_BASE64_RE = re.compile(
+    r"^(?:[A-Za-z0-9+/]{4})*(?:[A-Za-z0-9+/]{2}==|[A-Za-z0-9+/]{3}=)?$"
+)
+
+
 def safe_python_name(name: str) -> str:
-    begins_with_number = re.compile(r"^\d+")
-    safe_python_name_transformer = re.compile(r"[^0-9a-zA-Z_]")
-    remove_starting_dashes = re.compile(r"^-+")
-    remove_ending_dashes = re.compile(r"-+$")
-
-    if begins_with_number.match(name):
-        name = begins_with_number.sub("", name)
-    name = safe_python_name_transformer.sub("_", name)
-    if remove_starting_dashes.match(name):
-        name = remove_starting_dashes.sub("", name)
-    if remove_ending_dashes.search(name):
-        name = remove_ending_dashes.sub("", name)
+    name = _BEGINS_WITH_NUMBER_RE.sub("", name)
+    name = _UNSAFE_PYTHON_NAME_RE.sub("_", name)
+    name = _STARTING_DASHES_RE.sub("", name)
+    name = _ENDING_DASHES_RE.sub("", name)
     return name
 
 
@@ -57,9 +62,13 @@ def inject_trace_context(headers):
         logger.error(f"Error injecting trace context: {e}")
 
 
-def load_agent_module(agent_id: str, name: str, filename: str):
-    # Load the agent module dynamically
-    logger.debug(f"loading agent {agent_id} ({name}) from {filename}")
+@functools.lru_cache(maxsize=128)
+def _exec_agent_module(agent_id: str, filename: str, mtime_ns: int, size: int):
+    """
+    Import an agent module and return its (run, welcome) functions. The
+    file's mtime and size are part of the cache key, so an unchanged agent
+    is only imported once per process.
+    """
     spec = importlib.util.spec_from_file_location(agent_id, filename)
     if spec is None:
         raise ImportError(f"Could not load module for {filename}")
@@ -76,12 +85,21 @@ def load_agent_module(agent_id: str, name: str, filename: str):
     if hasattr(agent_module, "welcome"):
         welcome = agent_module.welcome
 
+    return agent_module.run, welcome
+
+
+def load_agent_module(agent_id: str, name: str, filename: str):
+    # Load the agent module dynamically
+    logger.debug(f"loading agent {agent_id} ({name}) from {filename}")
+    st = os.stat(filename)
+    run, welcome = _exec_agent_module(agent_id, filename, st.st_mtime_ns, st.st_size)
+
     logger.debug(f"Loaded agent: {agent_id}")
 
     return {
         "id": agent_id,
         "name": name,
-        "run": agent_module.run,
+        "run": run,
         "welcome": welcome,
     }
 
@@ -111,12 +129,7 @@ async def run_agent(
 
 def isBase64Content(val: Any) -> bool:
     if isinstance(val, str):
-        return (
-            re.match(
-                r"^(?:[A-Za-z0-9+/]{4})*(?:[A-Za-z0-9+/]{2}==|[A-Za-z0-9+/]{3}=)?$", val
-            )
-            is not None
-        )
+        return _BASE64_RE.match(val) is not None
     return False
 
 
@@ -162,10 +175,11 @@ async def handle_welcome_request(request: web.Request):
 
 async def handle_agent_welcome_request(request: web.Request):
     agents_by_id = request.app["agents_by_id"]
-    if request.match_info["agent_id"] in agents_by_id:
-        agent = agents_by_id[request.match_info["agent_id"]]
-        if "welcome" in agent and agent["welcome"] is not None:
-            fn = agent["welcome"]()
+    agent = agents_by_id.get(request.match_info["agent_id"])
+    if agent is not None:
+        welcome = agent.get("welcome")
+        if welcome is not None:
+            fn = welcome()
             if not isinstance(fn, dict):
                 fn = await encode_welcome(await fn)
             return web.json_response(fn)
@@ -203,8 +217,7 @@ def make_response_headers(
         for key, value in metadata.items():
             headers[f"x-agentuity-{key}"] = str(value)
     if additional is not None:
-        for key, value in additional.items():
-            headers[key] = value
+        headers |= additional
     return headers
 
 
@@ -314,17 +327,15 @@ async def handle_agent_request(request: web.Request):
     logger.debug(f"request: {request.method} {request.path}")
 
     # Check if the agent exists in our map
-    if agentId in agents_by_id:
-        agent = agents_by_id[agentId]
-        tracer = trace.get_tracer("http-server")
-
+    agent = agents_by_id.get(agentId)
+    if agent is not None:
         # Extract trace context from headers -- these MUST be lowercase for the propagator to work
         headers = dict()
         for k, v in request.headers.items():
             headers[k.lower()] = v
         context = extract(carrier=headers)
 
-        with tracer.start_as_current_span(
+        with _TRACER.start_as_current_span(
             f"HTTP {request.method}",
             context=context,
             kind=trace.SpanKind.SERVER,
@@ -429,21 +440,21 @@ async def handle_agent_request(request: web.Request):
                         "kv": KeyValueStore(
                             base_url=base_url,
                             api_key=api_key,
-                            tracer=tracer,
+                            tracer=_TRACER,
                         ),
                         "vector": VectorStore(
                             base_url=base_url,
                             api_key=api_key,
-                            tracer=tracer,
+                            tracer=_TRACER,
                         ),
                         "objectstore": ObjectStore(
                             base_url=base_url,
                             api_key=api_key,
-                            tracer=tracer,
+                            tracer=_TRACER,
                         ),
                     },
                     logger=logger,
-                    tracer=tracer,
+                    tracer=_TRACER,
                     agent=agent,
                     agents_by_id=agents_by_id,
                     port=port,
@@ -457,7 +468,12 @@ async def handle_agent_request(request: web.Request):
 
                 # Call the run function and get the response
                 response = await run_agent(
-                    tracer, agentId, agent, agent_request, agent_response, agent_context
+                    _TRACER,
+                    agentId,
+                    agent,
+                    agent_request,
+                    agent_response,
+                    agent_context,
                 )
 
                 if response is None:
@@ -557,14 +573,19 @@ async def handle_agent_request(request: web.Request):
         )
 
 
+# the health check body and version header never change, so build them once
+_HEALTH_CHECK_BODY = b"OK"
+_HEALTH_CHECK_HEADERS = {"x-agentuity-version": __version__}
+
+
 async def handle_health_check(request):
     return web.Response(
-        text="OK",
+        body=_HEALTH_CHECK_BODY,
         headers=make_response_headers(
             request,
             "text/plain",
             None,
-            dict({"x-agentuity-version": __version__}),
+            _HEALTH_CHECK_HEADERS,
         ),
     )
 
@@ -620,34 +641,58 @@ def get_agent_filepath(agent_name: str) -> str:
     return underscore_path
 
 
+def _yaml_safe_load(stream):
+    """
+    Parse YAML with the libyaml-backed CSafeLoader, falling back to the
+    pure-Python SafeLoader when PyYAML was built without libyaml.
+    """
+    import yaml
+
+    return yaml.load(stream, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader))
+
+
+@functools.lru_cache(maxsize=32)
+def _parse_config_file(path: str, mtime_ns: int, size: int):
+    """
+    Parse a JSON or YAML config file. The file's mtime and size are part of
+    the cache key, so an unchanged file is only parsed once per process.
+    """
+    with open(path, "r") as config_file:
+        if path.endswith(".json"):
+            return json.load(config_file)
+        return _yaml_safe_load(config_file)
+
+
+def _load_config_file(path: str):
+    st = os.stat(path)
+    return _parse_config_file(path, st.st_mtime_ns, st.st_size)
+
+
 def load_config() -> Tuple[Optional[dict], str]:
     # Load agents from config file
     config_data = None
     config_path = os.path.join(os.getcwd(), ".agentuity", "config.json")
     if os.path.exists(config_path):
         logger.info(f"Loading config from {config_path}")
-        with open(config_path, "r") as config_file:
-            config_data = json.load(config_file)
-            for agent in config_data["agents"]:
-                agent["filename"] = get_agent_filepath(agent["name"])
+        # copy so resolving filenames below doesn't mutate the cached parse
+        config_data = copy.deepcopy(_load_config_file(config_path))
+        for agent in config_data["agents"]:
+            agent["filename"] = get_agent_filepath(agent["name"])
     else:
         config_path = os.path.join(os.getcwd(), "agentuity.yaml")
         if os.path.exists(config_path):
             logger.debug(f"Loading config from {config_path}")
-            with open(config_path, "r") as config_file:
-                from yaml import safe_load
-
-                agent_config = safe_load(config_file)
-                config_data = {"agents": []}
-                config_data["environment"] = "development"
-                config_data["cli_version"] = "unknown"
-                config_data["app"] = {"name": agent_config["name"], "version": "dev"}
-                for agent in agent_config["agents"]:
-                    config = {}
-                    config["id"] = agent["id"]
-                    config["name"] = agent["name"]
-                    config["filename"] = get_agent_filepath(agent["name"])
-                    config_data["agents"].append(config)
+            agent_config = _load_config_file(config_path)
+            config_data = {"agents": []}
+            config_data["environment"] = "development"
+            config_data["cli_version"] = "unknown"
+            config_data["app"] = {"name": agent_config["name"], "version": "dev"}
+            for agent in agent_config["agents"]:
+                config = {}
+                config["id"] = agent["id"]
+                config["name"] = agent["name"]
+                config["filename"] = get_agent_filepath(agent["name"])
+                config_data["agents"].append(config)
         else:
             raise Exception(f"No config file found at {config_path}")
     return config_data, config_path
@@ -657,15 +702,20 @@ def load_agents(config_data):
     try:
         agents_by_id = {}
         for agent in config_data["agents"]:
-            if not os.path.exists(agent["filename"]):
+            logger.debug(f"Loading agent {agent['name']} from {agent['filename']}")
+            # load_agent_module stats the file, so a missing agent surfaces
+            # here without a separate existence check per agent
+            try:
+                agent_module = load_agent_module(
+                    agent_id=agent["id"],
+                    name=agent["name"],
+                    filename=agent["filename"],
+                )
+            except FileNotFoundError as e:
+                if e.filename != agent["filename"]:
+                    raise
                 logger.error(f"Agent {agent['name']} not found at {agent['filename']}")
                 sys.exit(1)
-            logger.debug(f"Loading agent {agent['name']} from {agent['filename']}")
-            agent_module = load_agent_module(
-                agent_id=agent["id"],
-                name=agent["name"],
-                filename=agent["filename"],
-            )
             agents_by_id[agent["id"]] = {
                 "id": agent["id"],
                 "name": agent["name"],
@@ -690,6 +740,26 @@ def load_agents(config_data):
         sys.exit(1)
 
 
+async def handle_cleanup(app: web.Application):
+    await close_http_client()
+
+
+# registration order matters: aiohttp matches routes in the order they were added
+_ROUTES = (
+    web.get("/", handle_index),
+    web.get("/_health", handle_health_check),
+    # agents must not run on HEAD, which web.get adds by default
+    web.get("/{agent_id}{tail:.*}", handle_agent_request, allow_head=False),
+    web.post("/{agent_id}{tail:.*}", handle_agent_request),
+    web.put("/{agent_id}{tail:.*}", handle_agent_request),
+    web.delete("/{agent_id}{tail:.*}", handle_agent_request),
+    web.patch("/{agent_id}{tail:.*}", handle_agent_request),
+    web.options("/{agent_id}{tail:.*}", handle_agent_options_request),
+    web.get("/welcome", handle_welcome_request),
+    web.get("/welcome/{agent_id}", handle_agent_welcome_request),
+)
+
+
 def autostart(callback: Callable[[], None] = None):
     # Create an event loop and run the async initialization
     loop = asyncio.new_event_loop()
@@ -730,14 +800,11 @@ def autostart(callback: Callable[[], None] = None):
     # Store agents_by_id in the app state
     app["agents_by_id"] = agents_by_id
 
+    # Release pooled agent-to-agent connections on shutdown
+    app.on_cleanup.append(handle_cleanup)
+
     # Add routes
-    app.router.add_get("/", handle_index)
-    app.router.add_get("/_health", handle_health_check)
-    for method in ["GET", "POST", "PUT", "DELETE", "PATCH"]:
-        app.router.add_route(method, "/{agent_id}{tail:.*}", handle_agent_request)
-    app.router.add_options("/{agent_id}{tail:.*}", handle_agent_options_request)
-    app.router.add_get("/welcome", handle_welcome_request)
-    app.router.add_get("/welcome/{agent_id}", handle_agent_welcome_request)
+    app.add_routes(_ROUTES)
 
     # Start the server
     logger.info(f"Starting server on port {port}")
@@ -6,6 +6,7 @@ from opentelemetry import trace
 from opentelemetry.propagate import inject
 import asyncio
 import logging
+import weakref
 from agentuity import __version__
 from .config import AgentConfig
 from .data import Data, DataLike, dataLikeToData
@@ -15,6 +16,59 @@ CONNECT_TIMEOUT = float(os.environ.get("AGENTUITY_CONNECT_TIMEOUT", "30.0"))
 READ_TIMEOUT = float(os.environ.get("AGENTUITY_READ_TIMEOUT", "300.0"))
 WRITE_TIMEOUT = float(os.environ.get("AGENTUITY_WRITE_TIMEOUT", "30.0"))
 POOL_TIMEOUT = float(os.environ.get("AGENTUITY_POOL_TIMEOUT", "10.0"))
+MAX_CONNECTIONS = int(os.environ.get("AGENTUITY_MAX_CONNECTIONS", "100"))
+MAX_KEEPALIVE_CONNECTIONS = int(
+    os.environ.get("AGENTUITY_MAX_KEEPALIVE_CONNECTIONS", "20")
+)
+
+# one client per event loop, since httpx connections belong to the loop that
+# opened them; a loop's client is dropped along with the loop
+_http_clients: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+_stream_tasks = set()
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """
+    Get the running event loop's HTTP client for agent invocations, creating it on
+    first use.
+
+    Reusing a client keeps its connection pool alive between calls instead of paying
+    for a new connection (and TLS handshake) on every invocation. Each event loop
+    gets its own client, so loops running in other threads are never affected.
+
+    The pool holds at most MAX_CONNECTIONS connections (AGENTUITY_MAX_CONNECTIONS,
+    default 100). Once the pool is full, further calls wait up to POOL_TIMEOUT
+    seconds for a free connection and then fail with httpx.PoolTimeout.
+
+    Returns:
+        httpx.AsyncClient: The shared client
+    """
+    loop = asyncio.get_running_loop()
+    client = _http_clients.get(loop)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(
+            timeout=httpx.Timeout(
+                connect=CONNECT_TIMEOUT,
+                read=READ_TIMEOUT,
+                write=WRITE_TIMEOUT,
+                pool=POOL_TIMEOUT,
+            ),
+            limits=httpx.Limits(
+                max_connections=MAX_CONNECTIONS,
+                max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS,
+            ),
+        )
+        _http_clients[loop] = client
+    return client
+
+
+async def close_http_client():
+    """
+    Close the running event loop's HTTP client, if one has been created.
+    """
+    client = _http_clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
 
 
 class RemoteAgentResponse:
@@ -104,38 +158,32 @@ class LocalAgent:
                     yield chunk
 
             try:
-                async with httpx.AsyncClient(
-                    timeout=httpx.Timeout(
-                        connect=CONNECT_TIMEOUT,
-                        read=READ_TIMEOUT,
-                        write=WRITE_TIMEOUT,
-                        pool=POOL_TIMEOUT,
-                    )
-                ) as client:
-                    response = await client.post(
-                        url, content=data_generator(), headers=headers
+                client = get_http_client()
+                request = client.build_request(
+                    "POST", url, content=data_generator(), headers=headers
+                )
+                # stream the body so it is relayed as it arrives rather than buffered
+                response = await client.send(request, stream=True)
+                span.set_attribute("http.status_code", response.status_code)
+                if response.status_code != 200:
+                    body = (await response.aread()).decode("utf-8")
+                    exception = Exception(body)
+                    span.record_exception(exception)
+                    span.set_status(trace.Status(trace.StatusCode.ERROR, body))
+                    # Log the error but don't call record_exception again
+                    logger = logging.getLogger(__name__)
+                    logger.error(
+                        f"LocalAgent communication failed for {self.agentconfig.id}: {body}"
                     )
-                    span.set_attribute("http.status_code", response.status_code)
-                    if response.status_code != 200:
-                        body = response.content.decode("utf-8")
-                        exception = Exception(body)
-                        span.record_exception(exception)
-                        span.set_status(trace.Status(trace.StatusCode.ERROR, body))
-                        # Log the error but don't call record_exception again
-                        logger = logging.getLogger(__name__)
-                        logger.error(
-                            f"LocalAgent communication failed for {self.agentconfig.id}: {body}"
-                        )
-                        raise exception
+                    raise exception
 
-                    stream = await create_stream_reader(response)
-                    contentType = response.headers.get(
-                        "content-type", "application/octet-stream"
-                    )
-                    span.set_status(trace.Status(trace.StatusCode.OK))
-                    return RemoteAgentResponse(
-                        Data(contentType, stream), response.headers
-                    )
+                stream = await create_stream_reader(response)
+                contentType = response.headers.get(
+                    "content-type", "application/octet-stream"
+                )
+                # the body is still streaming here, so leave the status unset
+                # rather than claim OK; read errors surface through the reader
+                return RemoteAgentResponse(Data(contentType, stream), response.headers)
             except Exception as e:
                 # Check if this is an HTTP error that was already handled above
                 # We can identify HTTP errors by checking if the exception message matches
@@ -212,44 +260,39 @@ class RemoteAgent:
                     yield chunk
 
             try:
-                async with httpx.AsyncClient(
-                    timeout=httpx.Timeout(
-                        connect=CONNECT_TIMEOUT,
-                        read=READ_TIMEOUT,
-                        write=WRITE_TIMEOUT,
-                        pool=POOL_TIMEOUT,
-                    )
-                ) as client:
-                    response = await client.post(
-                        self.agentconfig.get("url"),
-                        content=data_generator(),
-                        headers=headers,
-                    )
-                    if response.status_code != 200:
-                        error_msg = response.content.decode("utf-8")
-                        exception = Exception(error_msg)
-                        span.record_exception(exception)
-                        span.set_status(
-                            trace.Status(
-                                trace.StatusCode.ERROR,
-                                error_msg,
-                            )
-                        )
-                        # Log the error but don't call record_exception again
-                        logger = logging.getLogger(__name__)
-                        logger.error(
-                            f"RemoteAgent communication failed for {self.agentconfig.get('id')}: {error_msg}"
+                client = get_http_client()
+                request = client.build_request(
+                    "POST",
+                    self.agentconfig.get("url"),
+                    content=data_generator(),
+                    headers=headers,
+                )
+                # stream the body so it is relayed as it arrives rather than buffered
+                response = await client.send(request, stream=True)
+                if response.status_code != 200:
+                    error_msg = (await response.aread()).decode("utf-8")
+                    exception = Exception(error_msg)
+                    span.record_exception(exception)
+                    span.set_status(
+                        trace.Status(
+                            trace.StatusCode.ERROR,
+                            error_msg,
                         )
-                        raise exception
-
-                    stream = await create_stream_reader(response)
-                    contentType = response.headers.get(
-                        "content-type", "application/octet-stream"
                     )
-                    span.set_status(trace.Status(trace.StatusCode.OK))
-                    return RemoteAgentResponse(
-                        Data(contentType, stream), response.headers
+                    # Log the error but don't call record_exception again
+                    logger = logging.getLogger(__name__)
+                    logger.error(
+                        f"RemoteAgent communication failed for {self.agentconfig.get('id')}: {error_msg}"
                     )
+                    raise exception
+
+                stream = await create_stream_reader(response)
+                contentType = response.headers.get(
+                    "content-type", "application/octet-stream"
+                )
+                # the body is still streaming here, so leave the status unset
+                # rather than claim OK; read errors surface through the reader
+                return RemoteAgentResponse(Data(contentType, stream), response.headers)
             except Exception as e:
                 # Check if this is an HTTP error that was already handled above
                 if (
@@ -363,10 +406,24 @@ async def create_stream_reader(response):
         try:
             async for chunk in response.aiter_bytes():
                 reader.feed_data(chunk)
-        finally:
+        except asyncio.CancelledError:
+            # don't leave the reader waiting on a body that will never arrive
+            reader.set_exception(ConnectionError("Agent response stream was cancelled"))
+            raise
+        except Exception as e:
+            # pass the failure on so a truncated body isn't read as a clean EOF
+            logger = logging.getLogger(__name__)
+            logger.error(f"Error reading agent response: {e}")
+            reader.set_exception(e)
+        else:
             reader.feed_eof()
+        finally:
+            await response.aclose()
 
-    # Start feeding the reader in the background
-    asyncio.create_task(feed_reader())
+    # Start feeding the reader in the background, holding a reference so the task
+    # (and the pooled connection it reads from) isn't dropped before it finishes
+    task = asyncio.create_task(feed_reader())
+    _stream_tasks.add(task)
+    task.add_done_callback(_stream_tasks.discard)
 
     return reader
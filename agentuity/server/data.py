@@ -362,7 +362,7 @@ class Data(DataInterface):
             ValueError: If the data is not valid JSON
         """
         try:
-            return json.loads(await self.text())
+            return json.loads(await self.binary())
         except Exception as e:
             raise ValueError(f"Data is not JSON: {e}") from e
 
@@ -731,8 +731,7 @@ def dataLikeToData(value: DataLike, content_type: str = None) -> Data:
         return Data(content_type, StringStreamReader(payload))
     elif isinstance(value, (list, dict)):
         content_type = content_type or "application/json"
-        payload = json.dumps(value)
-        return Data(content_type, StringStreamReader(payload))
+        return Data(content_type, BytesStreamReader(json.dumps(value).encode("utf-8")))
     elif isinstance(value, (StreamReader, asyncio.StreamReader)):
         content_type = content_type or "application/octet-stream"
         return Data(content_type, value)
@@ -6,6 +6,18 @@ from asyncio import StreamReader
 from .data import Data, DataLike, dataLikeToData
 from .util import deprecated
 
+# size of each window yielded when streaming an in-memory buffer
+STREAM_CHUNK_SIZE = 64 * 1024
+
+
+def _iter_buffer(data: Union[bytes, bytearray, memoryview], chunk_size: int):
+    """
+    Yield fixed-size memoryview windows over a buffer without copying it.
+    """
+    view = memoryview(data)
+    for offset in range(0, len(view), chunk_size):
+        yield view[offset : offset + chunk_size]
+
 
 class AgentResponse:
     """
@@ -469,7 +481,8 @@ class AgentResponse:
         Args:
             data: An iterable or async iterator containing the data to stream. Can be any type of iterable
                 (list, generator, etc.) or async iterator containing any type of data. Also supports
-                another AgentResponse object for chaining streams.
+                another AgentResponse object for chaining streams. A bytes-like buffer is streamed
+                in STREAM_CHUNK_SIZE windows, without copying unless a transform is set.
             transform: Optional callable function that transforms each item in the stream
                 into a string. If not provided, items are returned as-is.
             contentType: The MIME type of the streamed content
@@ -487,6 +500,13 @@ class AgentResponse:
             # If data is an AgentResponse, we'll use its stream directly
             self._stream = data
             self._is_async = True  # AgentResponse is always async
+        elif isinstance(data, (bytes, bytearray, memoryview)):
+            # slice the buffer through a memoryview so each chunk is zero-copy
+            self._stream = _iter_buffer(data, STREAM_CHUNK_SIZE)
+            if transform is not None:
+                # transforms are written against bytes, so copy each window out
+                self._stream = map(bytes, self._stream)
+            self._is_async = False
         else:
             self._stream = data
             # Check if data is a coroutine, async iterator, or has __anext__ method
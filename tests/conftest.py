@@ -1,12 +1,16 @@
+import sys
 import pytest
 from unittest.mock import MagicMock
-from opentelemetry import trace
+
+# stub openlit before any test module imports agentuity; this has to happen at
+# conftest import time, since fixtures (even autouse ones) run after collection
+sys.modules.setdefault("openlit", MagicMock())
 
 
 @pytest.fixture
 def mock_tracer():
     """Create a mock tracer for testing."""
-    return MagicMock(spec=trace.Tracer)
+    return MagicMock()
 
 
 @pytest.fixture
@@ -1,11 +1,8 @@
-import sys
 from unittest.mock import patch, MagicMock
 import httpx
 from agentuity import __version__
 
-sys.modules["openlit"] = MagicMock()
-
-from agentuity.instrument.httpx_wrap import gateway_urls  # noqa: E402
+from agentuity.instrument.httpx_wrap import gateway_urls
 
 
 class TestHttpxWrap:
@@ -1,10 +1,7 @@
 import os
-import sys
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch
 
-sys.modules["openlit"] = MagicMock()
-
-from agentuity.instrument import (  # noqa: E402
+from agentuity.instrument import (
     is_module_available,
     check_provider,
     configure_litellm_provider,
@@ -1,11 +1,8 @@
 import os
-import sys
 from unittest.mock import patch, MagicMock
 from opentelemetry.sdk.resources import SERVICE_NAME, SERVICE_VERSION
 
-
-sys.modules["openlit"] = MagicMock()
-from agentuity.otel import init  # noqa: E402
+from agentuity.otel import init
 
 
 class TestOtelInit:
@@ -1,10 +1,6 @@
 import logging
-import sys
-from unittest.mock import MagicMock
 
-sys.modules["openlit"] = MagicMock()
-
-from agentuity.otel.logfilter import ModuleFilter, exclude_signatures  # noqa: E402
+from agentuity.otel.logfilter import ModuleFilter, exclude_signatures
 
 
 class TestModuleFilter:
@@ -1,11 +1,8 @@
 import pytest
 import logging
-import sys
 from unittest.mock import MagicMock
 
-sys.modules["openlit"] = MagicMock()
-
-from agentuity.otel.logger import create_logger  # noqa: E402
+from agentuity.otel.logger import create_logger
 
 
 class TestLogger:
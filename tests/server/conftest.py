@@ -0,0 +1,12 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+
+@pytest.fixture
+def mock_tracer():
+    """Create a mock tracer whose start_as_current_span() yields a shared span."""
+    tracer = MagicMock()
+    span = MagicMock()
+    tracer.start_as_current_span.return_value.__enter__.return_value = span
+    return tracer
@@ -1,15 +1,29 @@
 import pytest
-import sys
 import json
 import asyncio
 from unittest.mock import MagicMock, AsyncMock
 import httpx
-from opentelemetry import trace
 
-sys.modules["openlit"] = MagicMock()
+from agentuity.server.agent import (
+    RemoteAgentResponse,
+    RemoteAgent,
+    LocalAgent,
+    get_http_client,
+    close_http_client,
+    MAX_CONNECTIONS,
+    MAX_KEEPALIVE_CONNECTIONS,
+    create_stream_reader,
+    _stream_tasks,
+)
+from agentuity.server.config import AgentConfig
+from agentuity.server.data import Data
 
-from agentuity.server.agent import RemoteAgentResponse, RemoteAgent  # noqa: E402
-from agentuity.server.data import Data  # noqa: E402
+
+@pytest.fixture(autouse=True)
+async def reset_http_client():
+    """Close the shared HTTP client after each test so none leaks into the next."""
+    yield
+    await close_http_client()
 
 
 class TestRemoteAgentResponse:
@@ -43,17 +57,128 @@ class TestRemoteAgentResponse:
         assert response.metadata == {}
 
 
+class TestHttpClient:
+    """Test suite for the shared agent HTTP client."""
+
+    @pytest.mark.asyncio
+    async def test_get_http_client_reuses_client(self):
+        """Test the client is created once and reused until closed."""
+        client = get_http_client()
+        try:
+            assert isinstance(client, httpx.AsyncClient)
+            assert get_http_client() is client
+        finally:
+            await close_http_client()
+
+        assert client.is_closed
+        new_client = get_http_client()
+        try:
+            assert new_client is not client
+        finally:
+            await close_http_client()
+
+    @pytest.mark.asyncio
+    async def test_get_http_client_per_event_loop(self):
+        """Test a loop in another thread gets its own client and leaves ours open."""
+        client = get_http_client()
+
+        async def use_other_loop():
+            other = get_http_client()
+            await close_http_client()
+            return other
+
+        other = await asyncio.to_thread(asyncio.run, use_other_loop())
+
+        assert other is not client
+        assert not client.is_closed
+        assert get_http_client() is client
+
+    @pytest.mark.asyncio
+    async def test_get_http_client_limits(self, monkeypatch):
+        """Test the client pool is capped at the configured connection limits."""
+        mock_async_client = MagicMock(return_value=AsyncMock())
+        monkeypatch.setattr(httpx, "AsyncClient", mock_async_client)
+
+        get_http_client()
+
+        limits = mock_async_client.call_args.kwargs["limits"]
+        assert limits == httpx.Limits(
+            max_connections=MAX_CONNECTIONS,
+            max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS,
+        )
+
+    @pytest.mark.asyncio
+    async def test_close_http_client_without_client(self):
+        """Test closing when no client has been created is a no-op."""
+        await close_http_client()
+        await close_http_client()
+
+
+class TestCreateStreamReader:
+    """Test suite for create_stream_reader."""
+
+    @pytest.mark.asyncio
+    async def test_relays_chunks_and_closes_response(self):
+        """Test chunks are fed as they arrive and the response is closed after."""
+        mock_response = MagicMock(spec=httpx.Response)
+
+        async def mock_aiter_bytes():
+            yield b"Hello, "
+            yield b"world!"
+
+        mock_response.aiter_bytes = mock_aiter_bytes
+        mock_response.aclose = AsyncMock()
+
+        reader = await create_stream_reader(mock_response)
+
+        assert await reader.read() == b"Hello, world!"
+        mock_response.aclose.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_read_error_propagates(self):
+        """Test a failure partway through the body is raised from the reader."""
+        mock_response = MagicMock(spec=httpx.Response)
+
+        async def mock_aiter_bytes():
+            yield b"Hello, "
+            raise httpx.ReadError("connection reset")
+
+        mock_response.aiter_bytes = mock_aiter_bytes
+        mock_response.aclose = AsyncMock()
+
+        reader = await create_stream_reader(mock_response)
+
+        with pytest.raises(httpx.ReadError, match="connection reset"):
+            await reader.read()
+        mock_response.aclose.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_cancelled_feed_fails_reader(self):
+        """Test cancelling the feed task fails the reader instead of leaving it hanging."""
+        mock_response = MagicMock(spec=httpx.Response)
+
+        async def mock_aiter_bytes():
+            yield b"Hello, "
+            await asyncio.Event().wait()
+
+        mock_response.aiter_bytes = mock_aiter_bytes
+        mock_response.aclose = AsyncMock()
+
+        reader = await create_stream_reader(mock_response)
+        assert await reader.readexactly(7) == b"Hello, "
+
+        (task,) = _stream_tasks
+        task.cancel()
+
+        with pytest.raises(ConnectionError):
+            await asyncio.wait_for(reader.read(), timeout=1)
+        mock_response.aclose.assert_awaited_once()
+        assert not _stream_tasks
+
+
 class TestRemoteAgent:
     """Test suite for the RemoteAgent class."""
 
-    @pytest.fixture
-    def mock_tracer(self):
-        """Create a mock tracer for testing."""
-        tracer = MagicMock(spec=trace.Tracer)
-        span = MagicMock()
-        tracer.start_as_current_span.return_value.__enter__.return_value = span
-        return tracer
-
     @pytest.fixture
     def agent_config(self):
         """Create an AgentConfig for testing."""
@@ -99,9 +224,8 @@ class TestRemoteAgent:
         mock_response.aiter_bytes = mock_aiter_bytes
 
         mock_client = AsyncMock()
-        mock_client.post.return_value = mock_response
-        mock_client.__aenter__.return_value = mock_client
-        mock_client.__aexit__.return_value = None
+        mock_client.build_request = MagicMock()
+        mock_client.send.return_value = mock_response
 
         mock_stream_reader = asyncio.StreamReader()
         mock_stream_reader.feed_data(b"Response from agent")
@@ -133,10 +257,11 @@ class TestRemoteAgent:
         assert text == "Response from agent"
         assert result.metadata == {"key": "value"}
 
-        mock_client.post.assert_called_once()
-        args, kwargs = mock_client.post.call_args
+        mock_client.send.assert_called_once()
+        assert mock_client.send.call_args.kwargs["stream"] is True
+        args, kwargs = mock_client.build_request.call_args
 
-        assert args[0] == "http://127.0.0.1:3000/test_agent"
+        assert args == ("POST", "http://127.0.0.1:3000/test_agent")
         assert kwargs["headers"] is not None
 
         assert "content" in kwargs
@@ -145,7 +270,7 @@ class TestRemoteAgent:
         span.set_attribute.assert_any_call("@agentuity/agentId", "test_agent")
         span.set_attribute.assert_any_call("@agentuity/agentName", "Test Agent")
         span.set_attribute.assert_any_call("@agentuity/scope", "remote")
-        span.set_status.assert_called_once()
+        span.set_status.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_run_with_json_data(self, remote_agent, mock_tracer, monkeypatch):
@@ -163,9 +288,8 @@ class TestRemoteAgent:
         mock_response.aiter_bytes = mock_aiter_bytes
 
         mock_client = AsyncMock()
-        mock_client.post.return_value = mock_response
-        mock_client.__aenter__.return_value = mock_client
-        mock_client.__aexit__.return_value = None
+        mock_client.build_request = MagicMock()
+        mock_client.send.return_value = mock_response
 
         mock_stream_reader = asyncio.StreamReader()
         mock_stream_reader.feed_data(json.dumps({"result": "success"}).encode())
@@ -197,8 +321,8 @@ class TestRemoteAgent:
         json_data = await result.data.json()
         assert json_data == {"result": "success"}
 
-        mock_client.post.assert_called_once()
-        args, kwargs = mock_client.post.call_args
+        mock_client.send.assert_called_once()
+        args, kwargs = mock_client.build_request.call_args
 
         assert "content" in kwargs
 
@@ -215,9 +339,8 @@ class TestRemoteAgent:
         mock_response.aiter_bytes = mock_aiter_bytes
 
         mock_client = AsyncMock()
-        mock_client.post.return_value = mock_response
-        mock_client.__aenter__.return_value = mock_client
-        mock_client.__aexit__.return_value = None
+        mock_client.build_request = MagicMock()
+        mock_client.send.return_value = mock_response
 
         mock_stream_reader = asyncio.StreamReader()
         mock_stream_reader.feed_data(b"Binary response")
@@ -249,7 +372,7 @@ class TestRemoteAgent:
         binary_data = await result.data.binary()
         assert binary_data == b"Binary response"
 
-        mock_client.post.assert_called_once()
+        mock_client.send.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_run_with_metadata(self, remote_agent, mock_tracer, monkeypatch):
@@ -267,9 +390,8 @@ class TestRemoteAgent:
         mock_response.aiter_bytes = mock_aiter_bytes
 
         mock_client = AsyncMock()
-        mock_client.post.return_value = mock_response
-        mock_client.__aenter__.return_value = mock_client
-        mock_client.__aexit__.return_value = None
+        mock_client.build_request = MagicMock()
+        mock_client.send.return_value = mock_response
 
         mock_stream_reader = asyncio.StreamReader()
         mock_stream_reader.feed_data(b"Response with metadata")
@@ -299,8 +421,8 @@ class TestRemoteAgent:
         assert isinstance(result, RemoteAgentResponse)
         assert result.metadata == {"response_key": "response_value"}
 
-        mock_client.post.assert_called_once()
-        args, kwargs = mock_client.post.call_args
+        mock_client.send.assert_called_once()
+        args, kwargs = mock_client.build_request.call_args
 
         assert "x-agentuity-metadata" in kwargs["headers"]
         metadata_json = json.loads(kwargs["headers"]["x-agentuity-metadata"])
@@ -314,12 +436,12 @@ class TestRemoteAgent:
         mock_response.status_code = 500
         mock_response.headers = {}
         mock_response.content = b"Internal server error"
+        mock_response.aread = AsyncMock(return_value=b"Internal server error")
         mock_response.text = "Internal server error"
 
         mock_client = AsyncMock()
-        mock_client.post.return_value = mock_response
-        mock_client.__aenter__.return_value = mock_client
-        mock_client.__aexit__.return_value = None
+        mock_client.build_request = MagicMock()
+        mock_client.send.return_value = mock_response
 
         mock_async_client = MagicMock(return_value=mock_client)
         monkeypatch.setattr(httpx, "AsyncClient", mock_async_client)
@@ -342,3 +464,89 @@ class TestRemoteAgent:
         span = mock_tracer.start_as_current_span.return_value.__enter__.return_value
         span.record_exception.assert_called_once()
         span.set_status.assert_called_once()
+
+
+class TestLocalAgent:
+    """Test suite for the LocalAgent class."""
+
+    @pytest.fixture
+    def local_agent(self, mock_tracer):
+        """Create a LocalAgent instance for testing."""
+        agentconfig = AgentConfig({"id": "test_agent", "name": "Test Agent"})
+        return LocalAgent(agentconfig=agentconfig, port=3000, tracer=mock_tracer)
+
+    @pytest.fixture
+    def data(self):
+        """Create the Data sent to the local agent."""
+        reader = asyncio.StreamReader()
+        reader.feed_data(b"Hello, world!")
+        reader.feed_eof()
+        data = Data("text/plain", reader)
+
+        async def mock_stream():
+            return reader
+
+        data.stream = mock_stream
+        return data
+
+    @pytest.mark.asyncio
+    async def test_run(self, local_agent, data, mock_tracer, monkeypatch):
+        """Test running a local agent streams its response back."""
+        mock_response = MagicMock(spec=httpx.Response)
+        mock_response.status_code = 200
+        mock_response.headers = {
+            "content-type": "text/plain",
+            "x-agentuity-key": "value",
+        }
+
+        async def mock_aiter_bytes():
+            yield b"Response from agent"
+
+        mock_response.aiter_bytes = mock_aiter_bytes
+        mock_response.aclose = AsyncMock()
+
+        mock_client = AsyncMock()
+        mock_client.build_request = MagicMock()
+        mock_client.send.return_value = mock_response
+        monkeypatch.setattr(httpx, "AsyncClient", MagicMock(return_value=mock_client))
+
+        result = await local_agent.run(data, metadata={"key": "value"})
+
+        assert isinstance(result, RemoteAgentResponse)
+        assert result.data.content_type == "text/plain"
+        assert await result.data.text() == "Response from agent"
+        assert result.metadata == {"key": "value"}
+
+        assert mock_client.send.call_args.kwargs["stream"] is True
+        args, kwargs = mock_client.build_request.call_args
+        assert args == ("POST", "http://127.0.0.1:3000/test_agent")
+        assert kwargs["headers"]["x-agentuity-trigger"] == "agent"
+        assert kwargs["headers"]["x-agentuity-key"] == "value"
+        assert kwargs["headers"]["Content-Type"] == "text/plain"
+
+        span = mock_tracer.start_as_current_span.return_value.__enter__.return_value
+        span.set_attribute.assert_any_call("@agentuity/scope", "local")
+        span.set_attribute.assert_any_call("http.status_code", 200)
+        span.set_status.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_run_error(self, local_agent, data, mock_tracer, monkeypatch):
+        """Test a non-200 response raises with the error body."""
+        mock_response = MagicMock(spec=httpx.Response)
+        mock_response.status_code = 500
+        mock_response.headers = {}
+        mock_response.aread = AsyncMock(return_value=b"Internal server error")
+
+        mock_client = AsyncMock()
+        mock_client.build_request = MagicMock()
+        mock_client.send.return_value = mock_response
+        monkeypatch.setattr(httpx, "AsyncClient", MagicMock(return_value=mock_client))
+
+        with pytest.raises(Exception, match="Internal server error"):
+            await local_agent.run(data)
+
+        mock_response.aread.assert_awaited_once()
+        span = mock_tracer.start_as_current_span.return_value.__enter__.return_value
+        span.set_attribute.assert_any_call("http.status_code", 500)
+        span.record_exception.assert_called()
+        span.set_status.assert_called()
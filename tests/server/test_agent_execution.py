@@ -1,27 +1,15 @@
 import pytest
-import sys
 import os
 from unittest.mock import patch, MagicMock, AsyncMock
-from opentelemetry import trace
 
-sys.modules["openlit"] = MagicMock()
-
-from agentuity.server import run_agent, load_agent_module  # noqa: E402
-from agentuity.server.request import AgentRequest  # noqa: E402
-from agentuity.server.response import AgentResponse  # noqa: E402
+from agentuity.server import run_agent, load_agent_module
+from agentuity.server.request import AgentRequest
+from agentuity.server.response import AgentResponse
 
 
 class TestAgentExecution:
     """Test suite for agent execution functions."""
 
-    @pytest.fixture
-    def mock_tracer(self):
-        """Create a mock tracer."""
-        tracer = MagicMock(spec=trace.Tracer)
-        span = MagicMock()
-        tracer.start_as_current_span.return_value.__enter__.return_value = span
-        return tracer
-
     @pytest.fixture
     def mock_agents_by_id(self):
         """Create a mock agents_by_id dictionary."""
@@ -153,6 +141,24 @@ class TestAgentExecution:
             assert result["name"] == "Test Agent"
             assert callable(result["run"])
 
+    def test_load_agent_module_cached(self, tmp_path):
+        """Test an unchanged agent module is only imported once."""
+        module_path = tmp_path / "test_agent.py"
+        module_path.write_text("def run(request, response, context):\n    pass")
+
+        with patch("agentuity.server.logger.debug"):
+            first = load_agent_module("test_agent", "Test Agent", str(module_path))
+            second = load_agent_module("test_agent", "Test Agent", str(module_path))
+
+            assert second["run"] is first["run"]
+
+            module_path.write_text(
+                "def run(request, response, context):\n    return None"
+            )
+            third = load_agent_module("test_agent", "Test Agent", str(module_path))
+
+            assert third["run"] is not first["run"]
+
     def test_load_agent_module_missing_run(self, tmp_path):
         """Test loading an agent module without a run function."""
         module_path = tmp_path / "test_agent.py"
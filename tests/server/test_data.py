@@ -1,9 +1,7 @@
 import pytest
 import base64
 import json
-import sys
 import asyncio
-from unittest.mock import MagicMock
 from agentuity.server.data import (
     Data,
     DataResult,
@@ -11,8 +9,6 @@ from agentuity.server.data import (
     dataLikeToData,
 )
 
-sys.modules["openlit"] = MagicMock()
-
 
 def decode_payload(payload: str) -> str:
     """
@@ -1,27 +1,16 @@
 import pytest
-import sys
 import json
 from unittest.mock import MagicMock
 import httpx
 from opentelemetry import trace
 
-sys.modules["openlit"] = MagicMock()
-
-from agentuity.server.objectstore import ObjectStore, ObjectStorePutParams  # noqa: E402
-from agentuity.server.data import Data, DataResult  # noqa: E402
+from agentuity.server.objectstore import ObjectStore, ObjectStorePutParams
+from agentuity.server.data import Data, DataResult
 
 
 class TestObjectStore:
     """Test suite for the ObjectStore class."""
 
-    @pytest.fixture
-    def mock_tracer(self):
-        """Create a mock tracer for testing."""
-        tracer = MagicMock(spec=trace.Tracer)
-        span = MagicMock()
-        tracer.start_as_current_span.return_value.__enter__.return_value = span
-        return tracer
-
     @pytest.fixture
     def object_store(self, mock_tracer):
         """Create an ObjectStore instance for testing."""
@@ -1,12 +1,8 @@
 import pytest
-import sys
 import asyncio
-from unittest.mock import MagicMock
 
-sys.modules["openlit"] = MagicMock()
-
-from agentuity.server.request import AgentRequest  # noqa: E402
-from agentuity.server.data import Data  # noqa: E402
+from agentuity.server.request import AgentRequest
+from agentuity.server.data import Data
 
 
 class TestAgentRequest:
@@ -1,19 +1,12 @@
 import pytest
-import sys
 import json
 from unittest.mock import patch, MagicMock, AsyncMock
-from aiohttp.web import Request, Application, Response
-from opentelemetry import trace
 
-sys.modules["openlit"] = MagicMock()
-
-from agentuity.server import (  # noqa: E402
+from agentuity.server import (
     handle_agent_request,
-    handle_health_check,
-    handle_index,
+    handle_agent_welcome_request,
     inject_trace_context,
 )
-from agentuity.server.response import AgentResponse  # noqa: E402
 
 
 class TestRequestHandlers:
@@ -22,7 +15,7 @@ class TestRequestHandlers:
     @pytest.fixture
     def mock_app(self):
         """Create a mock application with agents_by_id."""
-        app = MagicMock(spec=Application)
+        app = MagicMock()
         app.__getitem__.return_value = {
             "test_agent": {
                 "id": "test_agent",
@@ -35,7 +28,7 @@ class TestRequestHandlers:
     @pytest.fixture
     def mock_request(self, mock_app):
         """Create a mock request object."""
-        request = MagicMock(spec=Request)
+        request = MagicMock()
         request.app = mock_app
         request.match_info = {"agent_id": "test_agent"}
         request.headers = {"Content-Type": "application/json"}
@@ -45,84 +38,19 @@ class TestRequestHandlers:
         request.url = "http://localhost/test_agent"
         return request
 
-    @pytest.fixture
-    def mock_tracer(self):
-        """Create a mock tracer."""
-        tracer = MagicMock(spec=trace.Tracer)
-        span = MagicMock()
-        tracer.start_as_current_span.return_value.__enter__.return_value = span
-        return tracer
-
-    @pytest.mark.asyncio
-    async def test_handle_health_check(self):
-        """Test health check endpoint."""
-        request = MagicMock()
-
-        mock_response = MagicMock(spec=Response)
-        mock_response.status = 200
-        mock_response.content_type = "text/plain"
-
-        with patch("agentuity.server.web.Response", return_value=mock_response):
-            response = await handle_health_check(request)
-
-            assert response.status == 200
-            assert response.content_type == "text/plain"
-
-    @pytest.mark.asyncio
-    async def test_handle_index(self, mock_request):
-        """Test index endpoint."""
-        mock_response = MagicMock(spec=Response)
-        mock_response.status = 200
-        mock_response.content_type = "text/plain"
-
-        with patch("agentuity.server.web.Response", return_value=mock_response):
-            response = await handle_index(mock_request)
-
-            assert response.status == 200
-            assert response.content_type == "text/plain"
-
     @pytest.mark.asyncio
     async def test_handle_agent_request_success(self, mock_request):
         """Test successful agent request handling."""
-        mock_response = MagicMock(spec=Response)
-        mock_response.status = 200
-        mock_response.content_type = "application/json"
-
-        # Create a mock span with proper trace_id formatting
-        mock_span_context = MagicMock()
-        mock_span_context.trace_id = 12345678901234567890123456789012345678
-        mock_span = MagicMock()
-        mock_span.get_span_context.return_value = mock_span_context
-        mock_span.is_recording.return_value = True
         mock_tracer = MagicMock()
-        mock_tracer.start_span.return_value.__enter__.return_value = mock_span
 
         with (
-            patch(
-                "agentuity.server.trace.get_tracer", return_value=mock_tracer
-            ) as mock_get_tracer,
+            patch("agentuity.server._TRACER", mock_tracer),
             patch("agentuity.server.extract", return_value={}),
             patch("agentuity.server.format_trace_id", return_value="test-trace-id"),
             patch(
                 "agentuity.server.run_agent", new_callable=AsyncMock
             ) as mock_run_agent,
-            patch("agentuity.server.web.json_response", return_value=mock_response),
         ):
-            agent_response = MagicMock(spec=AgentResponse)
-            agent_response.content_type = "text/plain"
-            agent_response._payload = "Test response"
-            agent_response._metadata = {"key": "value"}
-            agent_response.is_stream = False
-            agent_response.metadata = {"key": "value"}  # Add the property accessor
-
-            async def mock_anext():
-                raise StopAsyncIteration
-
-            agent_response.__aiter__ = AsyncMock(return_value=agent_response)
-            agent_response.__anext__ = mock_anext
-
-            mock_run_agent.return_value = agent_response
-
             mock_request.match_info = {"agent_id": "test_agent"}
             mock_request.app = {
                 "agents_by_id": {
@@ -145,59 +73,40 @@ class TestRequestHandlers:
                 response.content_type == "text/plain"
             )  # The actual content type returned is text/plain
 
-            mock_get_tracer.assert_called_once_with("http-server")
+            mock_tracer.start_as_current_span.assert_called_once()
 
     @pytest.mark.asyncio
-    async def test_handle_agent_request_agent_not_found(self, mock_request):
-        """Test agent request handling when agent is not found."""
-        mock_request.match_info = {"agent_id": "non_existent_agent"}
-
-        mock_response = MagicMock(spec=Response)
-        mock_response.status = 404
-        mock_response.content_type = "text/plain"
-
-        with patch("agentuity.server.web.Response", return_value=mock_response):
-            response = await handle_agent_request(mock_request)
-
-            assert response.status == 404
-            assert response.content_type == "text/plain"
-
-    @pytest.mark.asyncio
-    async def test_handle_agent_request_invalid_json(self, mock_request):
-        """Test agent request handling with invalid JSON."""
-        mock_request.json.side_effect = json.JSONDecodeError("Invalid JSON", "", 0)
-
-        mock_response = MagicMock(spec=Response)
-        mock_response.status = 400
-        mock_response.content_type = "text/plain"
+    async def test_handle_agent_welcome_request(self, mock_request):
+        """Test the welcome endpoint returns the agent's welcome payload."""
+        mock_request.app = {
+            "agents_by_id": {
+                "test_agent": {
+                    "id": "test_agent",
+                    "name": "Test Agent",
+                    "welcome": lambda: {"welcome": "Hello"},
+                }
+            }
+        }
 
-        with patch("agentuity.server.web.Response", return_value=mock_response):
-            response = await handle_agent_request(mock_request)
+        response = await handle_agent_welcome_request(mock_request)
 
-            assert response.status == 400
-            assert response.content_type == "text/plain"
+        assert response.status == 200
+        assert json.loads(response.body) == {"welcome": "Hello"}
 
     @pytest.mark.asyncio
-    async def test_handle_agent_request_exception(self, mock_request):
-        """Test agent request handling when an exception occurs."""
-        mock_response = MagicMock(spec=Response)
-        mock_response.status = 500
-        mock_response.content_type = "text/plain"
-
-        with (
-            patch("agentuity.server.trace.get_tracer", return_value=MagicMock()),
-            patch("agentuity.server.extract", return_value={}),
-            patch(
-                "agentuity.server.run_agent", new_callable=AsyncMock
-            ) as mock_run_agent,
-            patch("agentuity.server.web.Response", return_value=mock_response),
-        ):
-            mock_run_agent.side_effect = ValueError("Test error")
+    async def test_handle_agent_welcome_request_not_found(self, mock_request):
+        """Test the welcome endpoint 404s for unknown agents and agents without one."""
+        mock_request.app = {
+            "agents_by_id": {"test_agent": {"id": "test_agent", "welcome": None}}
+        }
 
-            response = await handle_agent_request(mock_request)
+        response = await handle_agent_welcome_request(mock_request)
+        assert response.status == 404
 
-            assert response.status == 500
-            assert response.content_type == "text/plain"
+        mock_request.match_info = {"agent_id": "missing_agent"}
+        response = await handle_agent_welcome_request(mock_request)
+        assert response.status == 404
+        assert response.text == "Agent missing_agent not found"
 
     def test_inject_trace_context(self):
         """Test inject_trace_context function."""
@@ -0,0 +1,83 @@
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestClient, TestServer
+
+from agentuity import __version__
+from agentuity.server import _ROUTES
+
+
+async def echo_run(request, response, context):
+    """Agent run function that echoes the request JSON back."""
+    return {"echo": await request.data.json()}
+
+
+async def failing_run(request, response, context):
+    """Agent run function that always fails."""
+    raise ValueError("Test error")
+
+
+@pytest.fixture
+async def client():
+    """Serve the real route table from an in-process aiohttp app."""
+    app = web.Application()
+    app["agents_by_id"] = {
+        "agent_echo": {"id": "agent_echo", "name": "Echo Agent", "run": echo_run},
+        "agent_fail": {"id": "agent_fail", "name": "Fail Agent", "run": failing_run},
+    }
+    app.add_routes(_ROUTES)
+
+    async with TestClient(TestServer(app)) as client:
+        yield client
+
+
+class TestRequestHandlersIntegration:
+    """Test the request handlers end to end through an aiohttp test server."""
+
+    async def test_health_check(self, client):
+        """Test the health check returns OK with the SDK version header."""
+        resp = await client.get("/_health")
+
+        assert resp.status == 200
+        assert resp.content_type == "text/plain"
+        assert resp.headers["x-agentuity-version"] == __version__
+        assert await resp.text() == "OK"
+
+    async def test_index(self, client):
+        """Test the index lists the registered agents."""
+        resp = await client.get("/")
+
+        assert resp.status == 200
+        assert resp.content_type == "text/plain"
+        body = await resp.text()
+        assert "POST /agent_echo - [Echo Agent]" in body
+        assert "POST /agent_fail - [Fail Agent]" in body
+
+    async def test_agent_request(self, client):
+        """Test an agent request runs the agent and returns its JSON result."""
+        resp = await client.post("/agent_echo", json={"message": "Hello, world!"})
+
+        assert resp.status == 200
+        assert resp.content_type == "application/json"
+        assert await resp.json() == {"echo": {"message": "Hello, world!"}}
+
+    async def test_agent_request_not_found(self, client):
+        """Test an unknown agent returns 404."""
+        resp = await client.post("/agent_missing", json={})
+
+        assert resp.status == 404
+        assert resp.content_type == "text/plain"
+        assert await resp.text() == "Agent agent_missing not found"
+
+    async def test_agent_request_head_not_allowed(self, client):
+        """Test HEAD does not run agents."""
+        resp = await client.head("/agent_echo")
+
+        assert resp.status == 405
+
+    async def test_agent_request_error(self, client):
+        """Test an agent failure returns 500 with the error message."""
+        resp = await client.post("/agent_fail", json={})
+
+        assert resp.status == 500
+        assert resp.content_type == "text/plain"
+        assert (await resp.text()).startswith("Test error")
@@ -1,15 +1,11 @@
 import pytest
 import asyncio
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 import json
-import sys
-from opentelemetry import trace
 
-sys.modules["openlit"] = MagicMock()
-
-from agentuity.server.response import AgentResponse  # noqa: E402
-from agentuity.server.data import Data  # noqa: E402
-from agentuity.server.context import AgentContext  # noqa: E402
+from agentuity.server.response import AgentResponse, STREAM_CHUNK_SIZE
+from agentuity.server.data import Data
+from agentuity.server.context import AgentContext
 
 
 class TestAgentResponse:
@@ -18,7 +14,7 @@ class TestAgentResponse:
     @pytest.fixture
     def mock_tracer(self):
         """Create a mock tracer for testing."""
-        return MagicMock(spec=trace.Tracer)
+        return MagicMock()
 
     @pytest.fixture
     def mock_agents_by_id(self):
@@ -86,6 +82,19 @@ class TestAgentResponse:
         assert agent_response.content_type == "application/octet-stream"
         assert agent_response._payload == binary_data
 
+    @pytest.mark.asyncio
+    async def test_binary_iterates_raw_bytes(self, agent_response):
+        """Test a binary payload is written as-is, without any base64 encoding."""
+        binary_data = b"\x00\x01 binary payload"
+        agent_response.binary(binary_data, "image/png")
+
+        with patch("base64.b64encode", side_effect=AssertionError("base64 used")):
+            chunk = await agent_response.__anext__()
+
+        assert chunk is binary_data
+        with pytest.raises(StopAsyncIteration):
+            await agent_response.__anext__()
+
     def test_empty(self, agent_response):
         """Test setting an empty response."""
         result = agent_response.empty()
@@ -151,3 +160,27 @@ class TestAgentResponse:
         agent_response._transform = lambda x: f"transformed: {x}"
         result = await agent_response.__anext__()
         assert result == b"transformed: b'chunk1'"
+
+    @pytest.mark.asyncio
+    async def test_stream_bytes_zero_copy(self, agent_response):
+        """Test streaming a large bytes payload yields memoryview windows over it."""
+        payload = bytes(range(256)) * 4096  # 1 MB
+        agent_response.stream(payload)
+
+        chunks = [chunk async for chunk in agent_response]
+
+        assert len(chunks) == len(payload) // STREAM_CHUNK_SIZE
+        for chunk in chunks:
+            assert isinstance(chunk, memoryview)
+            assert chunk.obj is payload
+        assert b"".join(chunks) == payload
+
+    @pytest.mark.asyncio
+    async def test_stream_bytes_with_transform(self, agent_response):
+        """Test a transform on a bytes payload receives each window as bytes."""
+        payload = b"a" * STREAM_CHUNK_SIZE + b"b"
+        agent_response.stream(payload, transform=lambda chunk: chunk.decode().upper())
+
+        chunks = [chunk async for chunk in agent_response]
+
+        assert chunks == [b"A" * STREAM_CHUNK_SIZE, b"B"]
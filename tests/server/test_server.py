@@ -1,62 +1,25 @@
-import pytest
-import os
-import tempfile
-import sys
-from unittest.mock import patch, MagicMock
+import re
 
-sys.modules["openlit"] = MagicMock()
-
-from agentuity.server import load_agent_module, inject_trace_context  # noqa: E402
+import agentuity.server
+from agentuity.server import safe_python_name, isBase64Content
 
 
 class TestServerFunctions:
     """Test suite for server initialization and utility functions."""
 
-    def test_inject_trace_context(self):
-        """Test inject_trace_context function."""
-        headers = {}
-        with patch("agentuity.server.inject") as mock_inject:
-            inject_trace_context(headers)
-            mock_inject.assert_called_once_with(headers)
-
-    def test_inject_trace_context_error(self):
-        """Test inject_trace_context handles errors."""
-        headers = {}
-        with (
-            patch("agentuity.server.inject", side_effect=Exception("Test error")),
-            patch("agentuity.server.logger.error") as mock_error,
-        ):
-            inject_trace_context(headers)
-            mock_error.assert_called_once()
-
-    def test_load_agent_module(self):
-        """Test load_agent_module function."""
-        with tempfile.NamedTemporaryFile(suffix=".py", delete=False) as f:
-            f.write(
-                b"def run(request, response, context): return response.text('Hello')"
-            )
-            module_path = f.name
-
-        try:
-            with patch("agentuity.server.logger.debug"):
-                result = load_agent_module("test_agent", "Test Agent", module_path)
-                assert result["id"] == "test_agent"
-                assert result["name"] == "Test Agent"
-                assert callable(result["run"])
-        finally:
-            os.unlink(module_path)
-
-    def test_load_agent_module_missing_run(self):
-        """Test load_agent_module raises AttributeError if run function is missing."""
-        with tempfile.NamedTemporaryFile(suffix=".py", delete=False) as f:
-            f.write(b"# Empty module without run function")
-            module_path = f.name
-
-        try:
-            with (
-                patch("agentuity.server.logger.debug"),
-                pytest.raises(AttributeError, match="does not have a run function"),
-            ):
-                load_agent_module("test_agent", "Test Agent", module_path)
-        finally:
-            os.unlink(module_path)
+    def test_safe_python_name(self):
+        """Test safe_python_name strips leading digits and replaces unsafe characters."""
+        assert safe_python_name("my-agent") == "my_agent"
+        assert safe_python_name("123agent") == "agent"
+        assert safe_python_name("My Test-Agent 123!") == "My_Test_Agent_123_"
+
+    def test_is_base64_content(self):
+        """Test isBase64Content detects base64 strings."""
+        assert isBase64Content("SGVsbG8sIHdvcmxkIQ==") is True
+        assert isBase64Content("Hello, world!") is False
+        assert isBase64Content(b"SGVsbG8=") is False
+
+    def test_patterns_are_precompiled(self):
+        """Test the name and base64 patterns are module-level compiled constants."""
+        assert isinstance(agentuity.server._UNSAFE_PYTHON_NAME_RE, re.Pattern)
+        assert isinstance(agentuity.server._BASE64_RE, re.Pattern)
@@ -1,12 +1,16 @@
 import pytest
-import sys
 import json
 from unittest.mock import patch, MagicMock
 import yaml
 
-sys.modules["openlit"] = MagicMock()
-
-from agentuity.server import load_config, load_agents, autostart, get_agent_filepath  # noqa: E402
+from agentuity.server import (
+    load_config,
+    load_agents,
+    autostart,
+    get_agent_filepath,
+    _yaml_safe_load,
+    _parse_config_file,
+)
 
 
 class TestServerConfig:
@@ -38,19 +42,9 @@ class TestServerConfig:
 
         with (
             patch("os.getcwd", return_value=str(tmp_path)),
-            patch("os.path.exists") as mock_exists,
-            patch("yaml.safe_load", return_value=config_data),
+            patch("os.path.exists", side_effect=lambda path: path == str(config_path)),
+            patch("agentuity.server._yaml_safe_load", return_value=config_data),
         ):
-
-            def exists_side_effect(path):
-                if ".agentuity/config.json" in path:
-                    return False
-                elif "agentuity.yaml" in path:
-                    return True
-                return False
-
-            mock_exists.side_effect = exists_side_effect
-
             result, _ = load_config()
 
             assert result is not None
@@ -58,6 +52,40 @@ class TestServerConfig:
             assert result["app"]["name"] == "test_agent"
             assert result["app"]["version"] == "dev"
 
+    def test_yaml_safe_load_prefers_c_loader(self):
+        """Test _yaml_safe_load uses CSafeLoader when libyaml is available."""
+        assert _yaml_safe_load("name: test") == {"name": "test"}
+
+        with patch("yaml.load") as mock_load:
+            _yaml_safe_load("name: test")
+
+            mock_load.assert_called_once_with(
+                "name: test", Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+            )
+
+    def test_load_config_caches_parse(self, tmp_path):
+        """Test load_config only re-parses the config file when it changes."""
+        config_path = tmp_path / "agentuity.yaml"
+        config_path.write_text(yaml.dump({"name": "test_app", "agents": []}))
+
+        with (
+            patch("os.getcwd", return_value=str(tmp_path)),
+            patch(
+                "agentuity.server._yaml_safe_load", wraps=_yaml_safe_load
+            ) as mock_load,
+        ):
+            first, _ = load_config()
+            second, _ = load_config()
+
+            assert mock_load.call_count == 1
+            assert first == second
+
+            config_path.write_text(yaml.dump({"name": "renamed_app", "agents": []}))
+            third, _ = load_config()
+
+            assert mock_load.call_count == 2
+            assert third["app"]["name"] == "renamed_app"
+
     def test_load_config_dot_agentuity(self, tmp_path):
         """Test loading configuration from .agentuity/config.json."""
         config_dir = tmp_path / ".agentuity"
@@ -102,6 +130,34 @@ class TestServerConfig:
             assert result["app"]["version"] == "1.0.0"
             assert "agents" in result
 
+    def test_load_config_does_not_mutate_cached_parse(self, tmp_path):
+        """Test the result of load_config() is independent of the cached parse."""
+        config_dir = tmp_path / ".agentuity"
+        config_dir.mkdir()
+        config_path = config_dir / "config.json"
+        config_path.write_text(
+            json.dumps(
+                {
+                    "app": {"name": "test_app"},
+                    "agents": [{"id": "test_agent", "name": "test_agent"}],
+                }
+            )
+        )
+
+        with patch("os.getcwd", return_value=str(tmp_path)):
+            result, _ = load_config()
+            result["app"]["name"] = "changed"
+            again, _ = load_config()
+
+        assert again["app"]["name"] == "test_app"
+
+        assert result["agents"][0]["filename"] == str(
+            tmp_path / "agentuity_agents" / "test_agent" / "agent.py"
+        )
+        st = config_path.stat()
+        cached = _parse_config_file(str(config_path), st.st_mtime_ns, st.st_size)
+        assert "filename" not in cached["agents"][0]
+
     def test_load_agents_success(self, tmp_path):
         """Test successful loading of agents."""
         agent_dir = tmp_path / "agents" / "test_agent"
@@ -125,7 +181,6 @@ class TestServerConfig:
             patch("agentuity.server.load_agent_module") as mock_load_agent_module,
             patch("agentuity.server.logger.info"),
             patch("agentuity.server.logger.debug"),
-            patch("os.path.exists", return_value=True),
         ):
             mock_load_agent_module.return_value = {
                 "id": "test_agent",
@@ -162,12 +217,31 @@ class TestServerConfig:
 
         with (
             patch("agentuity.server.logger.error") as mock_logger_error,
-            patch("os.path.exists", return_value=False),
             pytest.raises(SystemExit),
         ):
             load_agents(config_data)
 
-            mock_logger_error.assert_called_once()
+        mock_logger_error.assert_called_once_with(
+            "Agent Test Agent not found at /non/existent/path/agent.py"
+        )
+
+    def test_load_agents_agent_raises_file_not_found(self, tmp_path):
+        """Test a FileNotFoundError raised by the agent's own code isn't misreported."""
+        agent_file = tmp_path / "agent.py"
+        agent_file.write_text("open('/non/existent/data.txt')")
+        config_data = {
+            "agents": [
+                {"id": "test_agent", "name": "Test Agent", "filename": str(agent_file)}
+            ],
+        }
+
+        with (
+            patch("agentuity.server.logger.error") as mock_logger_error,
+            pytest.raises(SystemExit),
+        ):
+            load_agents(config_data)
+
+        assert "Error loading agent configuration" in mock_logger_error.call_args[0][0]
 
     def test_load_agents_json_error(self):
         """Test loading agents with a JSON decode error."""
@@ -187,7 +261,6 @@ class TestServerConfig:
         with (
             patch("agentuity.server.load_agent_module") as mock_load_agent_module,
             patch("agentuity.server.logger.error") as mock_logger_error,
-            patch("os.path.exists", return_value=True),
             pytest.raises(SystemExit),
         ):
             mock_load_agent_module.side_effect = json.JSONDecodeError(
@@ -250,9 +323,8 @@ class TestServerConfig:
 
             mock_app.__setitem__.assert_called_once_with("agents_by_id", mock_agents)
 
-            assert mock_app.router.add_get.call_count == 4
-            assert mock_app.router.add_route.call_count == 5
-            assert mock_app.router.add_options.call_count == 1
+            mock_app.add_routes.assert_called_once()
+            assert len(mock_app.add_routes.call_args[0][0]) == 10
 
             mock_run_app.assert_called_once()
             mock_logger_info.assert_called()
@@ -1,13 +1,9 @@
 import pytest
-import sys
 import os
-import yaml
 import tempfile
 from unittest.mock import patch, MagicMock, AsyncMock
 
-sys.modules["openlit"] = MagicMock()
-
-from agentuity.server import (  # noqa: E402
+from agentuity.server import (
     load_agents,
     load_agent_module,
     autostart,
@@ -17,44 +13,14 @@ from agentuity.server import (  # noqa: E402
 class TestServerInitialization:
     """Test suite for server initialization and agent loading."""
 
-    @pytest.fixture
-    def mock_yaml_config(self):
-        """Create a mock YAML configuration file."""
-        config = {
-            "agents": [
-                {
-                    "id": "test_agent",
-                    "name": "Test Agent",
-                    "module": "test_agent_module.py",
-                },
-                {
-                    "id": "another_agent",
-                    "name": "Another Agent",
-                    "module": "another_agent_module.py",
-                },
-            ]
-        }
-
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            yaml.dump(config, f)
-            config_path = f.name
-
-        yield config_path
-
-        os.unlink(config_path)
-
-    @pytest.fixture
-    def mock_agent_module(self):
+    @pytest.fixture(scope="session")
+    def mock_agent_module(self, tmp_path_factory):
         """Create a mock agent module file."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
-            f.write(
-                "async def run(request, response, context):\n    return response.text('Hello from test agent')"
-            )
-            module_path = f.name
-
-        yield module_path
-
-        os.unlink(module_path)
+        module_path = tmp_path_factory.mktemp("agent") / "agent.py"
+        module_path.write_text(
+            "async def run(request, response, context):\n    return response.text('Hello from test agent')"
+        )
+        return str(module_path)
 
     def test_load_agent_module(self, mock_agent_module):
         """Test loading an agent module."""
@@ -80,12 +46,10 @@ class TestServerInitialization:
         finally:
             os.unlink(module_path)
 
-    def test_load_agents(self, mock_yaml_config, mock_agent_module):
-        """Test loading agents from a YAML configuration file."""
+    def test_load_agents(self, mock_agent_module):
+        """Test loading every agent listed in the config."""
         with (
             patch("agentuity.server.logger.debug"),
-            patch("agentuity.server.os.path.exists", return_value=True),
-            patch("agentuity.server.os.path.isfile", return_value=True),
             patch("agentuity.server.load_agent_module") as mock_load_agent,
         ):
             mock_load_agent.return_value = {
@@ -94,30 +58,25 @@ class TestServerInitialization:
                 "run": AsyncMock(),
             }
 
-            with patch("agentuity.server.open", create=True) as mock_open:
-                mock_open.return_value.__enter__.return_value.read.return_value = open(
-                    mock_yaml_config
-                ).read()
-
-                mock_config_data = {
-                    "agents": [
-                        {
-                            "id": "test_agent",
-                            "name": "Test Agent",
-                            "filename": "test_agent_module.py",
-                        },
-                        {
-                            "id": "another_agent",
-                            "name": "Another Agent",
-                            "filename": "another_agent_module.py",
-                        },
-                    ]
-                }
-                agents = load_agents(mock_config_data)
-
-                assert "test_agent" in agents
-                assert "another_agent" in agents
-                assert mock_load_agent.call_count == 2
+            mock_config_data = {
+                "agents": [
+                    {
+                        "id": "test_agent",
+                        "name": "Test Agent",
+                        "filename": "test_agent_module.py",
+                    },
+                    {
+                        "id": "another_agent",
+                        "name": "Another Agent",
+                        "filename": "another_agent_module.py",
+                    },
+                ]
+            }
+            agents = load_agents(mock_config_data)
+
+            assert "test_agent" in agents
+            assert "another_agent" in agents
+            assert mock_load_agent.call_count == 2
 
     def test_load_agents_no_config(self):
         """Test loading agents when no configuration file exists."""
@@ -1,12 +1,9 @@
 import pytest
-import sys
 from unittest.mock import patch, MagicMock
 import httpx
 from opentelemetry import trace
 
-sys.modules["openlit"] = MagicMock()
-
-from agentuity.server.vector import VectorStore, VectorSearchResult  # noqa: E402
+from agentuity.server.vector import VectorStore, VectorSearchResult
 
 
 class TestVectorSearchResult:
@@ -39,14 +36,6 @@ class TestVectorSearchResult:
 class TestVectorStore:
     """Test suite for the VectorStore class."""
 
-    @pytest.fixture
-    def mock_tracer(self):
-        """Create a mock tracer for testing."""
-        tracer = MagicMock(spec=trace.Tracer)
-        span = MagicMock()
-        tracer.start_as_current_span.return_value.__enter__.return_value = span
-        return tracer
-
     @pytest.fixture
     def vector_store(self, mock_tracer):
         """Create a VectorStore instance for testing."""